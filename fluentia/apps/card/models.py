@@ -6,6 +6,7 @@ from fastapi import HTTPException, status
 from fluentia.apps.term.constants import Language
 from fluentia.apps.term.models import Term
 from fluentia.core.model.shortcut import create, update
+from fluentia.core.model.text import clean_text, sql_clean_text
 
 
 class CardSet(sm.SQLModel, table=True):
@@ -28,13 +29,9 @@ class CardSet(sm.SQLModel, table=True):
 
     @staticmethod
     def list(session, user_id, name=None):
-        filters = set()
+        filters = []
         if name:
-            filters.add(
-                sm.func.clean_text(CardSet.name).like(
-                    '%' + sm.func.clean_text(name) + '%'
-                )
-            )
+            filters.append(sql_clean_text(CardSet.name).like(f'%{clean_text(name)}%'))
         return session.exec(
             sm.select(CardSet).where(
                 CardSet.user_id == user_id,
@@ -87,16 +84,12 @@ class Card(sm.SQLModel, table=True):
 
     @staticmethod
     def list_query(cardset_id, term=None, note=None):
-        filters = set()
+        filters = []
         if term:
-            filters.add(
-                sm.func.clean_text(Card.term).like('%' + sm.func.clean_text(term) + '%')
-            )
+            filters.append(sql_clean_text(Card.term).like(f'%{clean_text(term)}%'))
         if note:
-            filters.add(
-                sm.func.clean_text(Card.note).like(
-                    '%' + sm.func.clean_text(note) + '%'
-                ),
+            filters.append(
+                sql_clean_text(Card.note).like(f'%{clean_text(note)}%'),
             )
         return sm.select(Card).where(Card.cardset_id == cardset_id, *filters)
 
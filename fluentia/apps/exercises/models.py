@@ -4,8 +4,9 @@ import sqlmodel as sm
 
 from fluentia.apps.exercises.constants import ExerciseType
 from fluentia.apps.term.constants import Language
-from fluentia.core.api.query import set_url_params
+from fluentia.core.api.query import set_url_params, url_path_for
 from fluentia.core.api.schema import Page
+from fluentia.core.model.shortcut import paginate
 
 
 class Exercise(sm.SQLModel, table=True):
@@ -46,6 +47,22 @@ class Exercise(sm.SQLModel, table=True):
             ['termdefinition.id'],
             ondelete='CASCADE',
         ),
+        sm.Index('ix_exercise_language_type', 'language', 'type'),
+        sm.Index('ix_exercise_pronunciation', 'pronunciation_id'),
+        sm.Index(
+            'ix_exercise_identity',
+            'type',
+            'language',
+            'translation_language',
+            'term',
+            'origin_language',
+            'term_example_id',
+            'pronunciation_id',
+            'term_lexical_id',
+            'term_definition_id',
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
     )
 
     @staticmethod
@@ -66,23 +83,20 @@ class Exercise(sm.SQLModel, table=True):
             TermDefinition,
             TermExample,
         )
-        from fluentia.main import app
 
-        filters = set()
-        or_statment = set()
+        filters = []
+        or_statment = []
         if level:
             if ExerciseType.is_term_exercise(exercise_type):
-                or_statment.add(
-                    sm.tuple_(Exercise.term, Exercise.origin_language).in_(
-                        sm.select(
-                            TermDefinition.term, TermDefinition.origin_language
-                        ).where(
-                            TermDefinition.level == level,
-                            TermDefinition.origin_language == language,
-                        )
+                or_statment.append(
+                    sm.exists().where(
+                        TermDefinition.term == Exercise.term,
+                        TermDefinition.origin_language == Exercise.origin_language,
+                        TermDefinition.level == level,
+                        TermDefinition.origin_language == language,
                     )
                 )
-                or_statment.add(
+                or_statment.append(
                     Exercise.term_lexical_id.in_(  # pyright: ignore[reportOptionalMemberAccess]
                         sm.select(TermDefinition.term_lexical_id).where(
                             TermDefinition.origin_language == language,
@@ -92,7 +106,7 @@ class Exercise(sm.SQLModel, table=True):
                     )
                 )
             if ExerciseType.is_sentence_exercise(exercise_type):
-                or_statment.add(
+                or_statment.append(
                     Exercise.term_example_id.in_(  # pyright: ignore[reportOptionalMemberAccess]
                         sm.select(TermExample.id).where(
                             TermExample.level == level,
@@ -102,38 +116,29 @@ class Exercise(sm.SQLModel, table=True):
                 )
             if ExerciseType.is_pronunciation_exercise(exercise_type):
                 if ExerciseType.LISTEN_TERM or ExerciseType.RANDOM:
-                    or_statment.add(
-                        Exercise.pronunciation_id.in_(  # pyright: ignore[reportOptionalMemberAccess]
-                            sm.select(PronunciationLink.pronunciation_id)
-                            .where(
-                                sm.tuple_(
-                                    PronunciationLink.term,
-                                    PronunciationLink.origin_language,
-                                ).in_(
-                                    sm.select(
-                                        TermDefinition.term,
-                                        TermDefinition.origin_language,
-                                    ).where(
-                                        TermDefinition.level == level,
-                                        TermDefinition.origin_language == language,
-                                    )
-                                )
-                            )
-                            .union(
-                                sm.select(PronunciationLink.pronunciation_id).where(
-                                    PronunciationLink.term_lexical_id.in_(  # pyright: ignore[reportOptionalMemberAccess]
-                                        sm.select(TermDefinition.term_lexical_id).where(
-                                            TermDefinition.level == level,
-                                            TermDefinition.origin_language == language,
-                                            TermDefinition.term_lexical_id.is_not(None),  # pyright: ignore[reportOptionalMemberAccess]
-                                        )
-                                    )
-                                )
-                            )
+                    or_statment.append(
+                        sm.exists().where(
+                            PronunciationLink.pronunciation_id
+                            == Exercise.pronunciation_id,
+                            sm.or_(
+                                sm.exists().where(
+                                    TermDefinition.term == PronunciationLink.term,
+                                    TermDefinition.origin_language
+                                    == PronunciationLink.origin_language,
+                                    TermDefinition.level == level,
+                                    TermDefinition.origin_language == language,
+                                ),
+                                sm.exists().where(
+                                    TermDefinition.term_lexical_id
+                                    == PronunciationLink.term_lexical_id,
+                                    TermDefinition.level == level,
+                                    TermDefinition.origin_language == language,
+                                ),
+                            ),
                         )
                     )
                 elif ExerciseType.LISTEN_SENTENCE or ExerciseType.RANDOM:
-                    or_statment.add(
+                    or_statment.append(
                         Exercise.pronunciation_id.in_(  # pyright: ignore[reportOptionalMemberAccess]
                             sm.select(PronunciationLink.pronunciation_id).where(
                                 PronunciationLink.term_example_id.in_(  # pyright: ignore[reportOptionalMemberAccess]
@@ -147,43 +152,35 @@ class Exercise(sm.SQLModel, table=True):
                     )
 
         if ExerciseType.is_translation_exercise(exercise_type):
-            or_statment.add(Exercise.translation_language == translation_language)
+            or_statment.append(Exercise.translation_language == translation_language)
 
-        filters.add(sm.or_(*or_statment))
+        filters.append(sm.or_(*or_statment))
 
         if cardset_id:
-            filters.add(
-                sm.tuple_(Exercise.term, Exercise.origin_language).in_(
-                    Card.list_query(cardset_id)
+            filters.append(
+                sm.exists().where(
+                    Card.cardset_id == cardset_id,
+                    Card.term == Exercise.term,
+                    Card.origin_language == Exercise.origin_language,
                 )
             )
         if exercise_type != ExerciseType.RANDOM:
-            filters.add(Exercise.type == exercise_type)
+            filters.append(Exercise.type == exercise_type)
 
         exercise_query = (
-            sm.select(
-                Exercise,
-                sm.func.count().over().label('total_count'),
-            )
+            sm.select(Exercise)
             .where(
                 Exercise.language == language,
-                **filters,
+                *filters,
             )
-            .offset((page - 1) * size)
-            .limit(size)
             .order_by(sm.func.MD5(Exercise.id + seed))
         )
-        rows = session.exec(exercise_query).all()
-
-        result_list = []
-        for row in rows:
-            db_exercise, _ = row
-            result_list.append(db_exercise)
+        result_list, total = paginate(session, exercise_query, page, size)
 
-        url = app.url_path_for('list_exercises')
+        url = url_path_for('list_exercises')
         return Page(
             items=result_list,
-            total=0 if len(rows) == 0 else rows[0][1],
+            total=total,
             next_page=set_url_params(
                 url,
                 exercise_type=exercise_type,
@@ -102,14 +102,14 @@ def get_term(
     lexical_list = []
     if lexical:
         lexical_list = [
-            schema.TermLexicalSchema(**lexical.model_dump())
+            schema.TermLexicalSchema.model_construct(**lexical.model_dump())
             for lexical in models.TermLexical.list(session, term, origin_language).items
         ]
 
     pronunciation_list = []
     if pronunciation:
         pronunciation_list = [
-            schema.PronunciationView(**db_pronunciation.model_dump())
+            schema.PronunciationView.model_construct(**db_pronunciation.model_dump())
             for db_pronunciation in models.Pronunciation.list(
                 session, term=term, origin_language=origin_language
             )
@@ -135,8 +135,11 @@ def search_term(
     session: Session,
     text: str,
     origin_language: constants.Language,
+    limit: int = Query(
+        default=20, ge=1, le=100, description='Número máximo de termos retornados.'
+    ),
 ):
-    return models.Term.search(session, text, origin_language)
+    return models.Term.search(session, text, origin_language, limit)
 
 
 @term_router.get(
@@ -196,7 +199,7 @@ def create_pronunciation(
     )
 
     session.refresh(db_pronuciation)
-    return schema.PronunciationView(**db_pronuciation.model_dump())
+    return schema.PronunciationView.model_construct(**db_pronuciation.model_dump())
 
 
 @term_router.get(
@@ -1,52 +1,113 @@
 import sqlmodel as sm
 from fastapi import HTTPException, status
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from sqlalchemy.event import listens_for
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager
 
 from fluentia.apps.exercises.constants import ExerciseType
 from fluentia.apps.exercises.models import Exercise
 from fluentia.apps.term import constants, schema
-from fluentia.core.api.query import set_url_params
+from fluentia.core.api.query import set_url_params, url_path_for
 from fluentia.core.api.schema import Page
 from fluentia.core.model.shortcut import (
     create,
     get_object_or_404,
-    get_or_create_object,
+    get_or_insert,
+    paginate,
     update,
 )
+from fluentia.core.model.text import clean_text, sql_clean_text
+
+
+def term_foreign_key():
+    return sm.ForeignKeyConstraint(
+        ['term', 'origin_language'],
+        ['term.term', 'term.origin_language'],
+        ondelete='CASCADE',
+    )
+
+
+def create_with_term(Model, session, **data):
+    resolved = (
+        Term.get_query(data.pop('term'), data['origin_language'])
+        .with_only_columns(Term.term)
+        .limit(1)
+        .cte('resolved')
+    )
+    columns = Model.__table__.c
+    db_model = session.exec(
+        insert(Model)
+        .from_select(
+            ['term', *data],
+            sm.select(
+                resolved.c.term,
+                *(sm.literal(value, columns[key].type) for key, value in data.items()),
+            ),
+        )
+        .returning(Model)
+    ).scalar_one_or_none()
+    if db_model is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail='Term does not exists.'
+        )
+    return db_model
+
+
+def update_merging_extra(session, db_model, **data):
+    Model = type(db_model)
+    extra = data.pop('extra', None)
+    if extra:
+        data['extra'] = sm.case(
+            (sm.func.jsonb_typeof(Model.extra) == 'object', Model.extra),
+            else_=sm.literal({}, JSONB),
+        ).op('||')(sm.literal(extra, JSONB))
+    if not data:
+        return db_model
+
+    db_model = session.exec(
+        sm.update(Model)
+        .where(
+            *(
+                column == getattr(db_model, column.key)
+                for column in Model.__table__.primary_key
+            )
+        )
+        .values(**data)
+        .returning(Model)
+        .execution_options(populate_existing=True)
+    ).scalar_one()
+    session.commit()
+    return db_model
 
 
 class Term(sm.SQLModel, table=True):
     term: str = sm.Field(primary_key=True)
     origin_language: constants.Language = sm.Field(primary_key=True)
 
-    __table_args__ = (sm.UniqueConstraint('term', 'origin_language'),)
-
     @staticmethod
     def get(session, term, origin_language):
-        term_query = (
-            sm.select(Term)
-            .where(
-                Term.origin_language == origin_language,
-                sm.func.clean_text(Term.term) == sm.func.clean_text(term),
-            )
-            .union(
-                sm.select(Term).where(
-                    sm.tuple_(Term.term, Term.origin_language).in_(
-                        sm.select(TermLexical.term, TermLexical.origin_language).where(
-                            sm.func.clean_text(TermLexical.value)
-                            == sm.func.clean_text(term),
-                            TermLexical.origin_language == origin_language,
-                            TermLexical.type == constants.TermLexicalType.FORM,
-                        )
-                    ),
-                )
-            )
+        terms = session.info.setdefault('terms', {})
+        key = (clean_text(term), origin_language)
+        if key not in terms:
+            terms[key] = session.exec(Term.get_query(term, origin_language)).first()
+        return terms[key]
+
+    @staticmethod
+    def get_query(term, origin_language):
+        cleaned_term = clean_text(term)
+        return sm.select(Term).where(
+            Term.origin_language == origin_language,
+            sm.or_(
+                sql_clean_text(Term.term) == cleaned_term,
+                sm.exists().where(
+                    TermLexical.term == Term.term,
+                    TermLexical.origin_language == Term.origin_language,
+                    sql_clean_text(TermLexical.value) == cleaned_term,
+                    TermLexical.type == constants.TermLexicalType.FORM,
+                ),
+            ),
         )
-        obj = session.exec(term_query).first()
-        if obj is not None:
-            obj = Term(**obj._mapping)
-        return obj
 
     @staticmethod
     def get_or_404(session, term, origin_language):
@@ -62,56 +123,95 @@ class Term(sm.SQLModel, table=True):
         obj = Term.get(session, **data)
         if obj is not None:
             return obj, False
-        return create(Term, session, **data), True
+        db_term, created = get_or_insert(
+            Term,
+            session,
+            [
+                Term.term == data['term'],
+                Term.origin_language == data['origin_language'],
+            ],
+            ['term', 'origin_language'],
+            **data,
+        )
+        if created:
+            insert_exercises(session.connection(), [speak_term_exercise(db_term)])
+            session.commit()
+            session.refresh(db_term)
+        return db_term, created
 
     @staticmethod
-    def search(session, text, origin_language):
-        return session.exec(
+    def search(session, text, origin_language, limit=20):
+        if not (cleaned_text := clean_text(text)):
+            return []
+        terms = list(
+            session.exec(Term.search_query(f'{cleaned_text}%', origin_language, limit))
+        )
+        if len(terms) < limit:
+            for db_term in session.exec(
+                Term.search_query(f'%{cleaned_text}%', origin_language, limit)
+            ):
+                if len(terms) == limit:
+                    break
+                if db_term not in terms:
+                    terms.append(db_term)
+        return terms
+
+    @staticmethod
+    def search_query(pattern, origin_language, limit):
+        return (
             sm.select(Term)
             .where(
                 Term.origin_language == origin_language,
-                sm.func.clean_text(Term.term).like(
-                    '%' + sm.func.clean_text(text) + '%'
-                ),
-            )
-            .union(
-                sm.select(Term).where(
-                    sm.tuple_(Term.term, Term.origin_language).in_(
-                        sm.select(TermLexical.term, TermLexical.origin_language).where(
-                            sm.func.clean_text(TermLexical.value).like(
-                                '%' + sm.func.clean_text(text) + '%'
-                            ),
-                            TermLexical.origin_language == origin_language,
-                            TermLexical.type == constants.TermLexicalType.FORM,
-                        )
+                sm.or_(
+                    sql_clean_text(Term.term).like(pattern),
+                    sm.exists().where(
+                        TermLexical.term == Term.term,
+                        TermLexical.origin_language == Term.origin_language,
+                        sql_clean_text(TermLexical.value).like(pattern),
+                        TermLexical.type == constants.TermLexicalType.FORM,
                     ),
-                )
+                ),
             )
+            .order_by(sm.func.length(Term.term), Term.term)
+            .limit(limit)
         )
 
     @staticmethod
     def search_term_meaning(session, text, origin_language, translation_language):
-        translation_query = (
-            sm.select(
-                TermDefinition.term,
-                TermDefinition.origin_language,
-            )
-            .where(
-                sm.func.clean_text(TermDefinitionTranslation.meaning).like(
-                    '%' + sm.func.clean_text(text) + '%'
+        if not (cleaned_text := clean_text(text)):
+            return []
+        cleaned_meaning = sql_clean_text(TermDefinitionTranslation.meaning)
+        terms = session.exec(
+            Term.search_meaning_query(
+                sm.func.to_tsvector('simple', cleaned_meaning).op('@@')(
+                    sm.func.websearch_to_tsquery('simple', cleaned_text)
                 ),
-                TermDefinition.origin_language == origin_language,
-                TermDefinitionTranslation.language == translation_language,
+                origin_language,
+                translation_language,
             )
-            .join(
-                TermDefinitionTranslation,
-                TermDefinition.id == TermDefinitionTranslation.term_definition_id,  # pyright: ignore[reportArgumentType]
-            )
-        )
-        return session.exec(
-            sm.select(Term).where(
-                sm.tuple_(Term.term, Term.origin_language).in_(translation_query)
+        ).all()
+        for db_term in session.exec(
+            Term.search_meaning_query(
+                cleaned_meaning.like(f'%{cleaned_text}%'),
+                origin_language,
+                translation_language,
             )
+        ):
+            if db_term not in terms:
+                terms.append(db_term)
+        return terms
+
+    @staticmethod
+    def search_meaning_query(match, origin_language, translation_language):
+        return sm.select(Term).where(
+            Term.origin_language == origin_language,
+            sm.exists().where(
+                TermDefinition.term == Term.term,
+                TermDefinition.origin_language == Term.origin_language,
+                TermDefinitionTranslation.term_definition_id == TermDefinition.id,
+                TermDefinitionTranslation.language == translation_language,
+                match,
+            ),
         )
 
 
@@ -133,24 +233,23 @@ class Pronunciation(sm.SQLModel, table=True):
 
     @staticmethod
     def list(session, **link_attributes):
-        filters = set()
-        if 'term' in link_attributes:
-            term = link_attributes.pop('term')
-            db_term = Term.get(session, term, link_attributes['origin_language'])
-            if db_term:
-                term = db_term.term
-            filters.add(
-                sm.func.clean_text(PronunciationLink.term) == sm.func.clean_text(term)
-            )
-        return session.exec(
+        term = link_attributes.pop('term', None)
+        pronunciation_query = (
             sm.select(Pronunciation)
             .join(
                 PronunciationLink,
-                Pronunciation.id == PronunciationLink.pronunciation_id,  # pyright: ignore[reportArgumentType]
+                PronunciationLink.pronunciation_id == Pronunciation.id,  # pyright: ignore[reportArgumentType]
             )
             .filter_by(**link_attributes)
-            .filter(*filters)
-        ).all()
+        )
+        if term is not None:
+            db_term = Term.get(session, term, link_attributes['origin_language'])
+            if db_term:
+                term = db_term.term
+            pronunciation_query = pronunciation_query.where(
+                PronunciationLink.term == term
+            )
+        return session.exec(pronunciation_query.execution_options(yield_per=100))
 
 
 class PronunciationLink(sm.SQLModel, table=True):
@@ -166,11 +265,7 @@ class PronunciationLink(sm.SQLModel, table=True):
             ['pronunciation.id'],
             ondelete='CASCADE',
         ),
-        sm.ForeignKeyConstraint(
-            ['term', 'origin_language'],
-            ['term.term', 'term.origin_language'],
-            ondelete='CASCADE',
-        ),
+        term_foreign_key(),
         sm.ForeignKeyConstraint(
             ['term_example_id'],
             ['termexample.id'],
@@ -181,6 +276,13 @@ class PronunciationLink(sm.SQLModel, table=True):
             ['termlexical.id'],
             ondelete='CASCADE',
         ),
+        sm.Index(
+            'ix_pl_term_origin',
+            'term',
+            'origin_language',
+            'term_example_id',
+            'term_lexical_id',
+        ),
     )
 
     @staticmethod
@@ -214,24 +316,32 @@ class TermDefinition(sm.SQLModel, table=True):
     origin_language: constants.Language
     part_of_speech: constants.PartOfSpeech
     definition: str
-    extra: sm.JSON | None = sm.Field(sa_column=sm.Column(sm.JSON))
+    extra: sm.JSON | None = sm.Field(sa_column=sm.Column(JSONB))
     level: constants.Level | None = None
     term_lexical_id: int | None = None
 
+    translations: list['TermDefinitionTranslation'] = sm.Relationship(
+        back_populates='term_definition',
+        sa_relationship_kwargs={'lazy': 'raise', 'passive_deletes': True},
+    )
+
     class Config:
         arbitrary_types_allowed = True
 
     __table_args__ = (
-        sm.ForeignKeyConstraint(
-            ['term', 'origin_language'],
-            ['term.term', 'term.origin_language'],
-            ondelete='CASCADE',
-        ),
+        term_foreign_key(),
         sm.ForeignKeyConstraint(
             ['term_lexical_id'],
             ['termlexical.id'],
             ondelete='CASCADE',
         ),
+        sm.Index(
+            'ix_termdefinition_term',
+            'term',
+            'origin_language',
+            'part_of_speech',
+            'level',
+        ),
     )
 
     @staticmethod
@@ -242,37 +352,57 @@ class TermDefinition(sm.SQLModel, table=True):
         part_of_speech=None,
         level=None,
     ):
-        filters = set()
+        filters = []
         if level:
-            filters.add(TermDefinition.level == level)
+            filters.append(TermDefinition.level == level)
         if part_of_speech:
-            filters.add(TermDefinition.part_of_speech == part_of_speech)
+            filters.append(TermDefinition.part_of_speech == part_of_speech)
         db_term = Term.get(session, term, origin_language)
         if db_term:
             term = db_term.term
 
-        query_definition = sm.select(TermDefinition).where(
-            sm.func.clean_text(TermDefinition.term) == sm.func.clean_text(term),
-            TermDefinition.origin_language == origin_language,
-            *filters,
+        query_definition = (
+            sm.select(TermDefinition)
+            .where(
+                TermDefinition.term == term,
+                TermDefinition.origin_language == origin_language,
+                *filters,
+            )
+            .order_by(TermDefinition.id)
         )
         return session.exec(query_definition)
 
     @staticmethod
     def get_or_create(session, **data):
-        db_definition = session.exec(
-            sm.select(TermDefinition).where(
-                sm.func.clean_text(TermDefinition.term)
-                == sm.func.clean_text(data['term']),
-                sm.func.clean_text(TermDefinition.definition)
-                == sm.func.clean_text(data['definition']),
+        db_term = Term.get_or_404(
+            session,
+            term=data['term'],
+            origin_language=data['origin_language'],
+        )
+        data['term'] = db_term.term
+
+        db_definition, created = get_or_insert(
+            TermDefinition,
+            session,
+            [
+                sql_clean_text(TermDefinition.term) == clean_text(data['term']),
                 TermDefinition.origin_language == data['origin_language'],
                 TermDefinition.part_of_speech == data['part_of_speech'],
-            )
-        ).first()
-        if db_definition is not None:
-            return db_definition, False
-        return TermDefinition.create(session, **data), True
+                sql_clean_text(TermDefinition.definition)
+                == clean_text(data['definition']),
+            ],
+            [
+                sql_clean_text(TermDefinition.term),
+                'origin_language',
+                'part_of_speech',
+                sql_clean_text(TermDefinition.definition),
+            ],
+            **data,
+        )
+        if created:
+            session.commit()
+            session.refresh(db_definition)
+        return db_definition, created
 
     @staticmethod
     def create(session, **data):
@@ -287,26 +417,30 @@ class TermDefinition(sm.SQLModel, table=True):
 
     @staticmethod
     def update(session, db_definition, **data):
-        extra = data.pop('extra', None)
-        if extra:
-            db_definition.extra = {**db_definition.extra, **extra}
+        return update_merging_extra(session, db_definition, **data)
 
-        for key, value in data.items():
-            setattr(db_definition, key, value)
 
-        session.commit()
-        session.refresh(db_definition)
-
-        return db_definition
+sm.Index(
+    'ix_termdefinition_clean_definition',
+    sql_clean_text(TermDefinition.term),
+    TermDefinition.origin_language,
+    TermDefinition.part_of_speech,
+    sql_clean_text(TermDefinition.definition),
+    unique=True,
+)
 
 
 class TermDefinitionTranslation(sm.SQLModel, table=True):
     language: constants.Language = sm.Field(primary_key=True)
     term_definition_id: int = sm.Field(primary_key=True)
-    extra: sm.JSON | None = sm.Field(sa_column=sm.Column(sm.JSON))
+    extra: sm.JSON | None = sm.Field(sa_column=sm.Column(JSONB))
     translation: str
     meaning: str
 
+    term_definition: TermDefinition = sm.Relationship(
+        back_populates='translations', sa_relationship_kwargs={'lazy': 'raise'}
+    )
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -316,6 +450,7 @@ class TermDefinitionTranslation(sm.SQLModel, table=True):
             ['termdefinition.id'],
             ondelete='CASCADE',
         ),
+        sm.Index('ix_tdt_definition_language', 'term_definition_id', 'language'),
     )
 
     @staticmethod
@@ -335,44 +470,46 @@ class TermDefinitionTranslation(sm.SQLModel, table=True):
         level=None,
         translation_language=None,
     ):
-        filters = set()
+        filters = []
         if level:
-            filters.add(TermDefinition.level == level)
+            filters.append(TermDefinition.level == level)
         if part_of_speech:
-            filters.add(TermDefinition.part_of_speech == part_of_speech)
+            filters.append(TermDefinition.part_of_speech == part_of_speech)
         db_term = Term.get(session, term, origin_language)
         if db_term:
             term = db_term.term
 
         query_translation = (
-            sm.select(
-                TermDefinition,
-                TermDefinitionTranslation,
-            )
+            sm.select(TermDefinition)
+            .join(TermDefinition.translations)  # pyright: ignore[reportArgumentType]
             .where(
-                sm.func.clean_text(TermDefinition.term) == sm.func.clean_text(term),
+                TermDefinition.term == term,
                 TermDefinition.origin_language == origin_language,
                 TermDefinitionTranslation.language == translation_language,
                 *filters,
             )
-            .join(
-                TermDefinitionTranslation,
-                TermDefinition.id == TermDefinitionTranslation.term_definition_id,  # pyright: ignore[reportArgumentType]
+            .order_by(TermDefinition.id)
+            .options(
+                contains_eager(TermDefinition.translations).load_only(  # pyright: ignore[reportArgumentType]
+                    TermDefinitionTranslation.translation,  # pyright: ignore[reportArgumentType]
+                    TermDefinitionTranslation.meaning,  # pyright: ignore[reportArgumentType]
+                )
             )
+            .execution_options(populate_existing=True)
         )
-        rows = session.exec(query_translation)
+        db_definitions = session.exec(query_translation).unique()
 
         result_list = []
-        for row in rows:
-            db_definition, db_definition_translation = row
-            result_list.append(
-                schema.TermDefinitionView(
-                    **db_definition.model_dump(),
-                    translation_language=db_definition_translation.language,
-                    translation_definition=db_definition_translation.translation,
-                    translation_meaning=db_definition_translation.meaning,
+        for db_definition in db_definitions:
+            for db_definition_translation in db_definition.translations:
+                result_list.append(
+                    schema.TermDefinitionView.model_construct(
+                        **db_definition.model_dump(),
+                        translation_language=db_definition_translation.language,
+                        translation_definition=db_definition_translation.translation,
+                        translation_meaning=db_definition_translation.meaning,
+                    )
                 )
-            )
         return result_list
 
     @staticmethod
@@ -390,6 +527,7 @@ class TermDefinitionTranslation(sm.SQLModel, table=True):
                 TermDefinition.origin_language == origin_language,
                 TermDefinitionTranslation.language == translation_language,
             )
+            .order_by(TermDefinition.id)
         )
         return session.exec(translation_query)
 
@@ -402,17 +540,23 @@ class TermExample(sm.SQLModel, table=True):
 
     @staticmethod
     def get_or_create(session, **data):
-        db_example = session.exec(
-            sm.select(TermExample).where(
-                sm.func.clean_text(TermExample.example)
-                == sm.func.clean_text(data['example']),
+        db_example, created = get_or_insert(
+            TermExample,
+            session,
+            [
+                sql_clean_text(TermExample.example) == clean_text(data['example']),
                 TermExample.language == data['language'],
+            ],
+            [sql_clean_text(TermExample.example), 'language'],
+            **data,
+        )
+        if created:
+            insert_exercises(
+                session.connection(), [speak_sentence_exercise(db_example)]
             )
-        ).first()
-
-        if db_example is not None:
-            return db_example, False
-        return TermExample.create(session, **data), True
+            session.commit()
+            session.refresh(db_example)
+        return db_example, created
 
     @staticmethod
     def create(session, **data):
@@ -420,38 +564,27 @@ class TermExample(sm.SQLModel, table=True):
 
     @staticmethod
     def list(session, page=1, size=50, **link_attributes):
-        from fluentia.main import app
-
-        filters = set()
+        filters = []
         term = link_attributes.pop('term', None)
         if term:
             db_term = Term.get(session, term, link_attributes['origin_language'])
             if db_term:
                 term = db_term.term
-            filters.add(
-                sm.func.clean_text(TermExampleLink.term) == sm.func.clean_text(term)
-            )
+            filters.append(TermExampleLink.term == term)
 
         example_list_query = (
-            sm.select(
-                TermExample,
-                TermExampleLink,
-                sm.func.count().over().label('total_count'),
-            )
+            sm.select(TermExample, TermExampleLink)
             .join(TermExampleLink, TermExample.id == TermExampleLink.term_example_id)  # pyright: ignore[reportArgumentType]
             .filter_by(**link_attributes)
             .where(*filters)
-            .offset((page - 1) * size)
-            .limit(size)
         )
 
-        rows = session.exec(example_list_query).all()
+        rows, total = paginate(session, example_list_query, page, size)
 
         result_list = []
-        for row in rows:
-            db_example, db_example_link, _ = row
+        for db_example, db_example_link in rows:
             result_list.append(
-                schema.TermExampleTranslationView(
+                schema.TermExampleTranslationView.model_construct(
                     **db_example.model_dump(),
                     **db_example_link.model_dump(exclude={'term_example_id', 'id'}),
                 )
@@ -459,10 +592,10 @@ class TermExample(sm.SQLModel, table=True):
 
         if term:
             link_attributes['term'] = term
-        url = app.url_path_for('list_example')
+        url = url_path_for('list_example')
         return Page(
             items=result_list,
-            total=0 if len(rows) == 0 else rows[0][2],
+            total=total,
             next_page=set_url_params(url, **link_attributes, page=page + 1, size=size),
             previous_page=None
             if page == 1
@@ -470,6 +603,14 @@ class TermExample(sm.SQLModel, table=True):
         )
 
 
+sm.Index(
+    'ix_termexample_clean_example',
+    sql_clean_text(TermExample.example),
+    TermExample.language,
+    unique=True,
+)
+
+
 class TermExampleLink(sm.SQLModel, table=True):
     id: int = sm.Field(primary_key=True)
     term_example_id: int
@@ -483,11 +624,7 @@ class TermExampleLink(sm.SQLModel, table=True):
     translation_language: constants.Language | None = None
 
     __table_args__ = (
-        sm.ForeignKeyConstraint(
-            ['term', 'origin_language'],
-            ['term.term', 'term.origin_language'],
-            ondelete='CASCADE',
-        ),
+        term_foreign_key(),
         sm.ForeignKeyConstraint(
             ['term_example_id'],
             ['termexample.id'],
@@ -534,25 +671,31 @@ class TermExampleLink(sm.SQLModel, table=True):
                 term_example_id=data['term_example_id'],
                 language=data['translation_language'],
             )
-        if 'term' in data:
-            db_term = Term.get_or_404(
-                session,
-                data['term'],
-                data['origin_language'],
-            )
-            data['term'] = db_term.term
-        elif 'term_definition_id' in data:
+        if 'term_definition_id' in data:
             get_object_or_404(TermDefinition, session, id=data['term_definition_id'])
         elif 'term_lexical_id' in data:
             get_object_or_404(TermLexical, session, id=data['term_lexical_id'])
 
         try:
-            return create(TermExampleLink, session, **data)
+            if 'term' in data:
+                db_link = create_with_term(TermExampleLink, session, **data)
+            else:
+                db_link = session.exec(
+                    insert(TermExampleLink)
+                    .values(**data)
+                    .on_conflict_do_nothing()
+                    .returning(TermExampleLink)
+                ).scalar_one_or_none()
         except IntegrityError:
+            db_link = None
+        if db_link is None:
+            session.rollback()
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail='the example is already linked with this model.',
             )
+        session.commit()
+        return db_link
 
 
 class TermExampleTranslation(sm.SQLModel, table=True):
@@ -562,37 +705,52 @@ class TermExampleTranslation(sm.SQLModel, table=True):
 
     @staticmethod
     def get_or_create(session, **data):
-        query = sm.select(TermExampleTranslation).where(
-            TermExampleTranslation.language == data['language'],
-            TermExampleTranslation.term_example_id == data['term_example_id'],
-            sm.func.clean_text(TermExampleTranslation.translation)
-            == sm.func.clean_text(data['translation']),
-        )
-        db_translation = session.exec(query).first()
-        if db_translation:
+        while True:
+            db_translation = session.exec(
+                insert(TermExampleTranslation)
+                .values(**data)
+                .on_conflict_do_nothing(index_elements=['language', 'term_example_id'])
+                .returning(TermExampleTranslation)
+            ).scalar_one_or_none()
+            if db_translation is not None:
+                connection = session.connection()
+                insert_exercises(
+                    connection, order_exercises(connection, [db_translation])
+                )
+                session.commit()
+                return db_translation, True
+
+            db_translation = session.get(
+                TermExampleTranslation,
+                (data['language'], data['term_example_id']),
+                populate_existing=True,
+            )
+            if db_translation is None:
+                continue
+            if clean_text(db_translation.translation) != clean_text(
+                data['translation']
+            ):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail='the example already has a translation in this language.',
+                )
             return db_translation, False
-        return create(TermExampleTranslation, session, **data), True
 
     @staticmethod
     def list(session, translation_language, page=1, size=50, **link_attributes):
-        from fluentia.main import app
-
-        filters = set()
+        filters = []
         term = link_attributes.pop('term', None)
         if term:
             db_term = Term.get(session, term, link_attributes['origin_language'])
             if db_term:
                 term = db_term.term
-            filters.add(
-                sm.func.clean_text(TermExampleLink.term) == sm.func.clean_text(term)
-            )
+            filters.append(TermExampleLink.term == term)
 
         example_list_query = (
             sm.select(
                 TermExample,
-                TermExampleTranslation,
+                TermExampleTranslation.translation,
                 TermExampleLink,
-                sm.func.count().over().label('total_count'),
             )
             .join(
                 TermExampleTranslation,
@@ -604,32 +762,29 @@ class TermExampleTranslation(sm.SQLModel, table=True):
             )
             .where(TermExampleTranslation.language == translation_language, *filters)
             .filter_by(**link_attributes)
-            .offset((page - 1) * size)
-            .limit(size)
         )
 
-        rows = session.exec(example_list_query).all()
+        rows, total = paginate(session, example_list_query, page, size)
 
         result_list = []
-        for row in rows:
-            db_example, db_example_translation, db_example_link, _ = row
+        for db_example, translation, db_example_link in rows:
             result_list.append(
-                schema.TermExampleTranslationView(
+                schema.TermExampleTranslationView.model_construct(
                     **db_example.model_dump(),
                     **db_example_link.model_dump(
                         exclude={'term_example_id', 'id', 'translation_language'}
                     ),
-                    translation_language=db_example_translation.language,
-                    translation_example=db_example_translation.translation,
+                    translation_language=translation_language,
+                    translation_example=translation,
                 )
             )
 
         if term:
             link_attributes['term'] = term
-        url = app.url_path_for('list_example')
+        url = url_path_for('list_example')
         return Page(
             items=result_list,
-            total=0 if len(rows) == 0 else rows[0][3],
+            total=total,
             next_page=set_url_params(
                 url,
                 **link_attributes,
@@ -654,6 +809,7 @@ class TermExampleTranslation(sm.SQLModel, table=True):
             ['termexample.id'],
             ondelete='CASCADE',
         ),
+        sm.Index('ix_tet_example_language', 'term_example_id', 'language'),
     )
 
 
@@ -663,63 +819,52 @@ class TermLexical(sm.SQLModel, table=True):
     origin_language: constants.Language
     value: str
     type: constants.TermLexicalType
-    extra: sm.JSON | None = sm.Field(sa_column=sm.Column(sm.JSON))
+    extra: sm.JSON | None = sm.Field(sa_column=sm.Column(JSONB))
 
     class Config:
         arbitrary_types_allowed = True
 
     __table_args__ = (
-        sm.ForeignKeyConstraint(
-            ['term', 'origin_language'],
-            ['term.term', 'term.origin_language'],
-            ondelete='CASCADE',
+        term_foreign_key(),
+        sm.Index('ix_termlexical_term', 'term', 'origin_language', 'type'),
+        sm.Index(
+            'ix_termlexical_antonym',
+            'term',
+            'origin_language',
+            postgresql_where=sm.text("type = 'ANTONYM'"),
         ),
     )
 
     @staticmethod
     def create(session, **data):
-        db_term = Term.get_or_404(
-            session,
-            term=data['term'],
-            origin_language=data['origin_language'],
-        )
-        data['term'] = db_term.term
-
-        return create(TermLexical, session, **data)
+        db_lexical = create_with_term(TermLexical, session, **data)
+        connection = session.connection()
+        insert_exercises(connection, mchoice_term_exercises(connection, [db_lexical]))
+        session.commit()
+        return db_lexical
 
     @staticmethod
     def list(session, term, origin_language, page=1, size=50, type=None):
-        from fluentia.main import app
-
         db_term = Term.get(session, term, origin_language)
         if db_term:
             term = db_term.term
         lexical_query = (
-            sm.select(
-                TermLexical,
-                sm.func.count().over().label('total_count'),
-            )
+            sm.select(TermLexical)
             .where(
-                sm.func.clean_text(TermLexical.term) == sm.func.clean_text(term),
+                TermLexical.term == term,
                 TermLexical.origin_language == origin_language,
             )
-            .offset((page - 1) * size)
-            .limit(size)
+            .order_by(TermLexical.id)
         )
         if type is not None:
             lexical_query = lexical_query.where(TermLexical.type == type.lower())
 
-        rows = session.exec(lexical_query).all()
+        result_list, total = paginate(session, lexical_query, page, size)
 
-        result_list = []
-        for row in rows:
-            db_lexical, _ = row
-            result_list.append(db_lexical)
-
-        url = app.url_path_for('list_lexical')
+        url = url_path_for('list_lexical')
         return Page(
             items=result_list,
-            total=0 if len(rows) == 0 else rows[0][1],
+            total=total,
             next_page=set_url_params(
                 url,
                 term=term,
@@ -742,194 +887,312 @@ class TermLexical(sm.SQLModel, table=True):
 
     @staticmethod
     def update(session, db_lexical, **data):
-        extra = data.pop('extra', None)
-        if extra:
-            db_lexical.extra = {**db_lexical.extra, **extra}
+        return update_merging_extra(session, db_lexical, **data)
 
-        for key, value in data.items():
-            setattr(db_lexical, key, value)
 
-        session.commit()
-        session.refresh(db_lexical)
+def order_exercises(connection, translations):
+    if not translations:
+        return []
 
-        return db_lexical
-
-
-@listens_for(TermExampleTranslation, 'after_insert')
-def insert_order_exercise(_, connection, target):
-    session = sm.Session(connection)
-
-    db_example = session.exec(
-        sm.select(TermExample).where(TermExample.id == target.term_example_id)
-    ).one()
-
-    get_or_create_object(
-        Exercise,
-        session,
-        language=db_example.language,
-        term_example_id=target.term_example_id,
-        translation_language=target.language,
-        type=ExerciseType.ORDER_SENTENCE,
+    example_ids = {translation.term_example_id for translation in translations}
+    example_languages = dict(
+        connection.execute(
+            sm.select(TermExample.id, TermExample.language).where(
+                TermExample.id.in_(list(example_ids))
+            )
+        ).all()
     )
-
-
-@listens_for(PronunciationLink, 'after_insert')
-def insert_listen_exercise(_, connection, target):
-    session = sm.Session(connection)
-
-    pronunciation = session.exec(
-        sm.select(Pronunciation).where(Pronunciation.id == target.pronunciation_id)
-    ).one()
-    if pronunciation.audio_file is None:
-        return
-
-    exercise_attr = {}
-    if target.term:
-        exercise_attr.update(
-            {
-                'term': target.term,
-                'origin_language': target.origin_language,
-                'language': target.origin_language,
-                'type': ExerciseType.LISTEN_TERM,
-            }
-        )
-    elif target.term_example_id:
-        db_example = session.exec(
-            sm.select(TermExample).where(TermExample.id == target.term_example_id)
-        ).one()
-
-        exercise_attr.update(
-            {
-                'language': db_example.language,
-                'term_example_id': target.term_example_id,
-                'type': ExerciseType.LISTEN_SENTENCE,
-            }
-        )
-    elif target.term_lexical_id:
-        db_lexical = session.exec(
-            sm.select(TermLexical).where(TermLexical.id == target.term_lexical_id)
-        ).one()
-
-        exercise_attr.update(
-            {
-                'language': db_lexical.origin_language,
-                'term_lexical_id': target.term_lexical_id,
-                'type': ExerciseType.LISTEN_TERM,
-            }
-        )
-
-    get_or_create_object(
-        Exercise,
-        session,
-        pronunciation_id=target.pronunciation_id,
-        **exercise_attr,
+    return [
+        {
+            'language': example_languages[translation.term_example_id],
+            'term_example_id': translation.term_example_id,
+            'translation_language': translation.language,
+            'type': ExerciseType.ORDER_SENTENCE,
+        }
+        for translation in translations
+    ]
+
+
+def listen_exercises(connection, links):
+    if not links:
+        return []
+
+    audio_ids = set(
+        connection.execute(
+            sm.select(Pronunciation.id).where(
+                Pronunciation.id.in_([link.pronunciation_id for link in links]),
+                Pronunciation.audio_file.is_not(None),
+            )
+        ).scalars()
+    )
+    links = [link for link in links if link.pronunciation_id in audio_ids]
+    example_ids = {link.term_example_id for link in links if link.term_example_id}
+    lexical_ids = {link.term_lexical_id for link in links if link.term_lexical_id}
+    example_languages = dict(
+        connection.execute(
+            sm.select(TermExample.id, TermExample.language).where(
+                TermExample.id.in_(list(example_ids))
+            )
+        ).all()
+        if example_ids
+        else ()
+    )
+    lexical_languages = dict(
+        connection.execute(
+            sm.select(TermLexical.id, TermLexical.origin_language).where(
+                TermLexical.id.in_(list(lexical_ids))
+            )
+        ).all()
+        if lexical_ids
+        else ()
     )
 
+    exercises = []
+    for link in links:
+        exercise_attr = {'pronunciation_id': link.pronunciation_id}
+        if link.term:
+            exercise_attr.update(
+                {
+                    'term': link.term,
+                    'origin_language': link.origin_language,
+                    'language': link.origin_language,
+                    'type': ExerciseType.LISTEN_TERM,
+                }
+            )
+        elif link.term_example_id:
+            exercise_attr.update(
+                {
+                    'language': example_languages[link.term_example_id],
+                    'term_example_id': link.term_example_id,
+                    'type': ExerciseType.LISTEN_SENTENCE,
+                }
+            )
+        elif link.term_lexical_id:
+            exercise_attr.update(
+                {
+                    'language': lexical_languages[link.term_lexical_id],
+                    'term_lexical_id': link.term_lexical_id,
+                    'type': ExerciseType.LISTEN_TERM,
+                }
+            )
+        exercises.append(exercise_attr)
+    return exercises
+
 
 @listens_for(Pronunciation, 'after_update')
 def update_listen_exercise(_, connection, target):
-    session = sm.Session(connection)
-
     if not target.audio_file:
-        db_exercise = session.exec(
-            sm.select(Exercise).where(
+        connection.execute(
+            sm.delete(Exercise).where(
                 Exercise.pronunciation_id == target.id,
                 Exercise.type.in_(
                     (ExerciseType.LISTEN_SENTENCE, ExerciseType.LISTEN_TERM)
                 ),
             )
-        ).first()
-        if db_exercise:
-            session.delete(db_exercise)
-            session.commit()
+        )
     else:
-        link = session.exec(
-            sm.select(PronunciationLink).where(
-                PronunciationLink.pronunciation_id == target.id
+        exercise_type = Exercise.__table__.c.type.type
+        exercise_query = (
+            sm.select(
+                PronunciationLink.pronunciation_id,
+                PronunciationLink.term,
+                PronunciationLink.origin_language,
+                PronunciationLink.term_example_id,
+                PronunciationLink.term_lexical_id,
+                sm.func.coalesce(
+                    PronunciationLink.origin_language,
+                    TermExample.language,
+                    TermLexical.origin_language,
+                ),
+                sm.cast(
+                    sm.case(
+                        (
+                            sm.and_(
+                                PronunciationLink.term.is_(None),
+                                PronunciationLink.term_example_id.is_not(None),
+                            ),
+                            sm.literal(ExerciseType.LISTEN_SENTENCE, exercise_type),
+                        ),
+                        else_=sm.literal(ExerciseType.LISTEN_TERM, exercise_type),
+                    ),
+                    exercise_type,
+                ),
+            )
+            .outerjoin(
+                TermExample,
+                TermExample.id == PronunciationLink.term_example_id,  # pyright: ignore[reportArgumentType]
+            )
+            .outerjoin(
+                TermLexical,
+                TermLexical.id == PronunciationLink.term_lexical_id,  # pyright: ignore[reportArgumentType]
+            )
+            .where(
+                PronunciationLink.pronunciation_id == target.id,
+                ~sm.exists().where(
+                    Exercise.pronunciation_id == target.id,
+                    Exercise.type.in_(
+                        (ExerciseType.LISTEN_SENTENCE, ExerciseType.LISTEN_TERM)
+                    ),
+                ),
+            )
+        )
+        connection.execute(
+            insert(Exercise).from_select(
+                [
+                    'pronunciation_id',
+                    'term',
+                    'origin_language',
+                    'term_example_id',
+                    'term_lexical_id',
+                    'language',
+                    'type',
+                ],
+                exercise_query,
             )
-        ).first()
-        if link:
-            insert_listen_exercise(None, connection, link)
+        )
 
 
-@listens_for(Term, 'after_insert')
-def insert_speak_term_exercise(_, connection, target):
-    session = sm.Session(connection)
+def speak_term_exercise(term):
+    return {
+        'term': term.term,
+        'origin_language': term.origin_language,
+        'language': term.origin_language,
+        'type': ExerciseType.SPEAK_TERM,
+    }
 
-    get_or_create_object(
-        Exercise,
-        session,
-        term=target.term,
-        origin_language=target.origin_language,
-        language=target.origin_language,
-        type=ExerciseType.SPEAK_TERM,
-    )
 
+def speak_sentence_exercise(example):
+    return {
+        'term_example_id': example.id,
+        'type': ExerciseType.SPEAK_SENTENCE,
+        'language': example.language,
+    }
 
-@listens_for(TermExample, 'after_insert')
-def insert_speak_sentence_exercise(_, connection, target):
-    session = sm.Session(connection)
 
-    get_or_create_object(
-        Exercise,
-        session,
-        term_example_id=target.id,
-        type=ExerciseType.SPEAK_SENTENCE,
-        language=target.language,
+def antonym_query(term, origin_language):
+    return (
+        sm.select(sm.literal(1))
+        .where(
+            TermLexical.term == term,
+            TermLexical.origin_language == origin_language,
+            TermLexical.type == constants.TermLexicalType.ANTONYM,
+        )
+        .offset(2)
+        .limit(1)
     )
 
 
-@listens_for(TermLexical, 'after_insert')
-def insert_mchoice_term_exercise(_, connection, target):
-    if target.type != constants.TermLexicalType.ANTONYM:
+def mchoice_term_exercises(connection, lexicals):
+    terms = {
+        (lexical.term, lexical.origin_language)
+        for lexical in lexicals
+        if lexical.type == constants.TermLexicalType.ANTONYM
+    }
+    if not terms:
+        return []
+
+    rows = connection.execute(
+        sm.select(Term.term, Term.origin_language).where(
+            sm.tuple_(Term.term, Term.origin_language).in_(list(terms)),
+            antonym_query(Term.term, Term.origin_language).exists(),
+            ~sm.exists().where(
+                Exercise.term == Term.term,
+                Exercise.origin_language == Term.origin_language,
+                Exercise.type == ExerciseType.MCHOICE_TERM,
+            ),
+        )
+    ).all()
+    return [
+        {
+            'term': term,
+            'origin_language': origin_language,
+            'type': ExerciseType.MCHOICE_TERM,
+            'language': origin_language,
+        }
+        for term, origin_language in rows
+    ]
+
+
+def mchoice_term_translation_exercises(connection, translations):
+    if not translations:
+        return []
+
+    definition_ids = {translation.term_definition_id for translation in translations}
+    definition_languages = dict(
+        connection.execute(
+            sm.select(TermDefinition.id, TermDefinition.origin_language).where(
+                TermDefinition.id.in_(list(definition_ids)),
+                antonym_query(
+                    TermDefinition.term, TermDefinition.origin_language
+                ).exists(),
+            )
+        ).all()
+    )
+    return [
+        {
+            'translation_language': translation.language,
+            'language': definition_languages[translation.term_definition_id],
+            'term_definition_id': translation.term_definition_id,
+            'type': ExerciseType.MCHOICE_TERM_TRANSLATION,
+        }
+        for translation in translations
+        if translation.term_definition_id in definition_languages
+    ]
+
+
+def insert_exercises(connection, exercises):
+    exercises = {tuple(exercise.items()): exercise for exercise in exercises}
+    if not exercises:
         return
 
-    session = sm.Session(connection)
+    columns = dict.fromkeys(key for exercise in exercises.values() for key in exercise)
+    connection.execute(
+        insert(Exercise)
+        .values([columns | exercise for exercise in exercises.values()])
+        .on_conflict_do_nothing()
+    )
 
-    count = session.exec(
-        sm.select(
-            sm.func.count(TermLexical.id),  # pyright: ignore[reportArgumentType]
-        ).where(
-            TermLexical.term == target.term,
-            TermLexical.origin_language == target.origin_language,
-            TermLexical.type == constants.TermLexicalType.ANTONYM,
-        )
-    ).all()[0]
-    if count >= 3:
-        get_or_create_object(
-            Exercise,
-            session,
-            term=target.term,
-            origin_language=target.origin_language,
-            type=ExerciseType.MCHOICE_TERM,
-            language=target.origin_language,
-        )
 
+EXERCISE_BUILDERS = {
+    Term: lambda _, terms: map(speak_term_exercise, terms),
+    TermExample: lambda _, examples: map(speak_sentence_exercise, examples),
+    TermExampleTranslation: order_exercises,
+    PronunciationLink: listen_exercises,
+    TermLexical: mchoice_term_exercises,
+    TermDefinitionTranslation: mchoice_term_translation_exercises,
+}
 
-@listens_for(TermDefinitionTranslation, 'after_insert')
-def insert_mchoice_term_translation_exercise(_, connection, target):
-    session = sm.Session(connection)
 
-    definition = session.exec(
-        sm.select(TermDefinition).where(TermDefinition.id == target.term_definition_id)
-    ).one()
+@listens_for(sm.Session, 'after_flush')
+def collect_exercises(session, _):
+    new = {}
+    for obj in session.new:
+        if type(obj) in EXERCISE_BUILDERS:
+            new.setdefault(type(obj), []).append(obj)
+    if not new:
+        return
 
-    count = session.exec(
-        sm.select(
-            sm.func.count(TermLexical.id),  # pyright: ignore[reportArgumentType]
-        ).where(
-            TermLexical.term == definition.term,
-            TermLexical.origin_language == definition.origin_language,
-            TermLexical.type == constants.TermLexicalType.ANTONYM,
-        )
-    ).all()[0]
+    connection = session.connection()
+    insert_exercises(
+        connection,
+        [
+            exercise
+            for Model, objs in new.items()
+            for exercise in EXERCISE_BUILDERS[Model](connection, objs)
+        ],
+    )
 
-    if count >= 3:
-        get_or_create_object(
-            Exercise,
-            session,
-            translation_language=target.language,
-            language=definition.origin_language,
-            term_definition_id=definition.id,
-            type=ExerciseType.MCHOICE_TERM_TRANSLATION,
-        )
+
+@listens_for(sm.Session, 'after_flush')
+def invalidate_term_cache(session, _):
+    if any(
+        isinstance(obj, (Term, TermLexical))
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        session.info.pop('terms', None)
+
+
+@listens_for(sm.Session, 'after_commit')
+@listens_for(sm.Session, 'after_rollback')
+def clear_term_cache(session):
+    session.info.pop('terms', None)
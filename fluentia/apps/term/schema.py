@@ -1,6 +1,12 @@
 from typing import ClassVar, Self
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 from fluentia.apps.term import constants
 
@@ -18,33 +24,38 @@ class TermSchema(TermSchemaBase):
     pronunciations: list['PronunciationView'] | None = Field(default_factory=list)
 
 
+PRONUNCIATION_LINK_FIELDS = (
+    'term',
+    'origin_language',
+    'term_example_id',
+    'term_lexical_id',
+)
+EXAMPLE_LINK_FIELDS = (
+    'term',
+    'origin_language',
+    'term_definition_id',
+    'term_lexical_id',
+)
+
+
 class PronunciationLinkSchema(BaseModel):
     term: str | None = Field(examples=['Casa'], default=None)
     origin_language: constants.Language | None = None
     term_example_id: int | None = None
     term_lexical_id: int | None = None
 
-    link_fields: ClassVar[set] = {
-        'term',
-        'origin_language',
-        'term_example_id',
-        'term_lexical_id',
-    }
+    link_fields: ClassVar[set] = set(PRONUNCIATION_LINK_FIELDS)
 
     @model_validator(mode='after')
     def link_validation(self) -> Self:
-        link_attributes = {
-            field: getattr(self, field)
-            for field in PronunciationLinkSchema.link_fields
-            if getattr(self, field, None) is not None
-        }
-        link_count = len(link_attributes.values())
+        link_count = 0
+        for field in PRONUNCIATION_LINK_FIELDS:
+            if getattr(self, field) is not None:
+                link_count += 1
         if link_count == 0:
             raise ValueError('you need to provide at least one object to link.')
-        elif 'term' in link_attributes or 'origin_language' in link_attributes:
-            if not all(
-                [link_attributes.get('term'), link_attributes.get('origin_language')]
-            ):
+        elif self.term is not None or self.origin_language is not None:
+            if not (self.term and self.origin_language):
                 raise ValueError(
                     'you need to provide term and origin_language attributes.'
                 )
@@ -68,10 +79,16 @@ class PronunciationSchema(PronunciationLinkSchema):
     description: str | None = Field(examples=['português do brasil'], default=None)
 
     def model_dump(self, *args, **kwargs):
-        exclude = kwargs.pop('exclude', {})
-        return super().model_dump(
-            *args, **kwargs, exclude={*self.link_fields, *exclude}
-        )
+        exclude = kwargs.pop('exclude', None)
+        if exclude:
+            exclude = self.link_fields | set(exclude)
+        else:
+            exclude = self.link_fields
+        if not args and not kwargs:
+            return {
+                key: value for key, value in self.__dict__.items() if key not in exclude
+            }
+        return super().model_dump(*args, **kwargs, exclude=exclude)
 
 
 class PronunciationView(BaseModel):
@@ -155,19 +172,24 @@ class TermDefinitionTranslationUpdate(BaseModel):
 
 
 class ExampleHighlightValidator:
-    @model_validator(mode='after')
-    def validate_highlight(self) -> Self:
-        example = getattr(self, 'example', None) or getattr(self, 'translation')
+    @field_validator('highlight')
+    @classmethod
+    def validate_highlight(
+        cls, highlight: list[list[int]], info: ValidationInfo
+    ) -> list[list[int]]:
+        example = info.data.get('example') or info.data.get('translation')
+        if example is None:
+            return highlight
+        example_len = len(example) - 1
 
         intervals = []
-        for value in self.highlight:
+        for value in highlight:
             if len(value) != 2:
                 raise ValueError(
                     'highlight must consist of pairs of numbers representing the start and end positions.'
                 )
 
             v1, v2 = value
-            example_len = len(example) - 1
             if v1 > example_len or v2 > example_len:
                 raise ValueError(
                     'highlight cannot be greater than the length of the example.'
@@ -181,14 +203,16 @@ class ExampleHighlightValidator:
                     'highlight beginning value cannot be greater than the ending value, since it represents the start and end positions.'
                 )
 
-            interval = range(v1, v2 + 1)
-            if any([i in intervals for i in interval]):
+            intervals.append((v1, v2))
+
+        intervals.sort()
+        for (_, previous_end), (start, _) in zip(intervals, intervals[1:]):
+            if start <= previous_end:
                 raise ValueError(
                     'highlight interval must not overlap with any other intervals in highlight list.'
                 )
-            intervals.extend(interval)
 
-        return self
+        return highlight
 
 
 class TermExampleLinkSchema(BaseModel):
@@ -197,27 +221,18 @@ class TermExampleLinkSchema(BaseModel):
     term_definition_id: int | None = None
     term_lexical_id: int | None = None
 
-    link_fields: ClassVar[set] = {
-        'term',
-        'origin_language',
-        'term_definition_id',
-        'term_lexical_id',
-    }
+    link_fields: ClassVar[set] = set(EXAMPLE_LINK_FIELDS)
 
     @model_validator(mode='after')
     def link_validation(self) -> Self:
-        link_attributes = {
-            field: getattr(self, field)
-            for field in TermExampleLinkSchema.link_fields
-            if getattr(self, field, None) is not None
-        }
-        link_count = len(link_attributes.values())
+        link_count = 0
+        for field in EXAMPLE_LINK_FIELDS:
+            if getattr(self, field) is not None:
+                link_count += 1
         if link_count == 0:
             raise ValueError('you need to provide at least one object to link.')
-        elif 'term' in link_attributes or 'origin_language' in link_attributes:
-            if not all(
-                [link_attributes.get('term'), link_attributes.get('origin_language')]
-            ):
+        elif self.term is not None or self.origin_language is not None:
+            if not (self.term and self.origin_language):
                 raise ValueError(
                     'you need to provide term and origin_language attributes.'
                 )
@@ -2,8 +2,8 @@ from typing import Annotated
 
 from fastapi import Depends, HTTPException
 from fastapi.routing import APIRouter
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session as SQLModelSession
-from sqlmodel import select
 
 from fluentia.apps.user.models import User
 from fluentia.apps.user.schema import UserSchema, UserSchemaUpdate, UserView
@@ -32,10 +32,6 @@ Session = Annotated[SQLModelSession, Depends(get_session)]
     description='Endpoint utilizado para a criação de um novo usuário.',
 )
 def create_user(user_schema: UserSchema, session: Session):
-    db_user = session.exec(select(User).where(User.email == user_schema.email)).first()
-    if db_user is not None:
-        raise HTTPException(status_code=409, detail='email already registered.')
-
     payload = user_schema.model_dump()
     password = payload.pop('password')
     hashed_password = get_password_hash(password)
@@ -44,10 +40,20 @@ def create_user(user_schema: UserSchema, session: Session):
     db_user = User(**payload)
 
     session.add(db_user)
-    session.commit()
+    try:
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        raise HTTPException(status_code=409, detail='email already registered.')
     session.refresh(db_user)
 
-    return db_user
+    return UserView.model_construct(
+        id=db_user.id,
+        username=db_user.username,
+        native_language=db_user.native_language,
+        created=db_user.created,
+        is_superuser=db_user.is_superuser,
+    )
 
 
 @user_router.patch(
@@ -63,6 +69,12 @@ def create_user(user_schema: UserSchema, session: Session):
                 'application/json': {'example': {'detail': 'user does not exists.'}}
             },
         },
+        409: {
+            'description': 'Email já cadastrado.',
+            'content': {
+                'application/json': {'example': {'detail': 'email already registered.'}}
+            },
+        },
     },
     summary='Atualizar um usuário existente.',
     description='Endpoint utilizado para a atualizar um usuário existente.',
@@ -79,7 +91,17 @@ def update_user(
     for key, value in user_schema.model_dump(exclude_none=True).items():
         setattr(current_user, key, value)
 
-    session.commit()
+    try:
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        raise HTTPException(status_code=409, detail='email already registered.')
     session.refresh(current_user)
 
-    return current_user
+    return UserView.model_construct(
+        id=current_user.id,
+        username=current_user.username,
+        native_language=current_user.native_language,
+        created=current_user.created,
+        is_superuser=current_user.is_superuser,
+    )
@@ -3,13 +3,13 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlmodel import Session as SQLModelSession
-from sqlmodel import select
 
 from fluentia.apps.user.auth.schema import Token
 from fluentia.apps.user.models import User
 from fluentia.apps.user.security import (
     create_access_token,
     get_current_user,
+    user_by_email_query,
     verify_password,
 )
 from fluentia.database import get_session
@@ -43,7 +43,9 @@ def login_for_access_token(
     form_data: OAuth2Form,
     session: Session,
 ):
-    user = session.exec(select(User).where(User.email == form_data.username)).first()
+    user = session.exec(
+        user_by_email_query, params={'email': form_data.username}
+    ).first()
 
     if not user:
         raise HTTPException(status_code=400, detail='Incorrect email or password')
@@ -53,7 +55,7 @@ def login_for_access_token(
 
     access_token = create_access_token(data={'sub': user.email})
 
-    return {'access_token': access_token, 'token_type': 'bearer'}
+    return Token.model_construct(access_token=access_token, token_type='bearer')
 
 
 @auth_router.post(
@@ -69,4 +71,4 @@ def login_for_access_token(
 def refresh_access_token(user: Annotated[User, Depends(get_current_user)]):
     new_access_token = create_access_token(data={'sub': user.email})
 
-    return {'access_token': new_access_token, 'token_type': 'bearer'}
+    return Token.model_construct(access_token=new_access_token, token_type='bearer')
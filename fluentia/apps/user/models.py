@@ -6,7 +6,7 @@ from sqlmodel import Field, SQLModel
 class User(SQLModel, table=True):
     id: int = Field(primary_key=True)
     username: str
-    email: str
+    email: str = Field(unique=True, index=True)
     password: str
     created: datetime = Field(default_factory=datetime.utcnow)
     native_language: str
@@ -6,24 +6,24 @@ from fastapi.security import OAuth2PasswordBearer
 from jwt import DecodeError, ExpiredSignatureError, decode, encode
 from passlib.context import CryptContext
 from passlib.exc import UnknownHashError
+from sqlalchemy import bindparam
 from sqlmodel import Session, select
 
 from fluentia.apps.user.auth.schema import TokenData
 from fluentia.apps.user.models import User
 from fluentia.database import get_session
-from fluentia.settings import Settings
+from fluentia.settings import get_settings
 
-settings = Settings()
+settings = get_settings()
 pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='auth/token')
+access_token_expire = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+user_by_email_query = select(User).where(User.email == bindparam('email'))
 
 
 def create_access_token(data: dict[str, str | datetime]) -> str:
-    to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({'exp': expire})
-    encoded_jwt = encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    to_encode = data | {'exp': datetime.utcnow() + access_token_expire}
+    return encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
 def get_password_hash(password: str) -> str:
@@ -56,7 +56,9 @@ def get_current_user(
     except (DecodeError, ExpiredSignatureError):
         raise credentials_exception
 
-    user = session.exec(select(User).where(User.email == token_data.username)).first()
+    user = session.exec(
+        user_by_email_query, params={'email': token_data.username}
+    ).first()
 
     if user is None:
         raise credentials_exception
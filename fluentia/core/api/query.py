@@ -1,8 +1,19 @@
+from functools import cache
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 
+@cache
+def url_path_for(name):
+    from fluentia.main import app
+
+    return app.url_path_for(name)
+
+
 def set_url_params(url, **params):
-    params = dict(filter(lambda item: item[1] is not None, params.items()))
+    params = {key: value for key, value in params.items() if value is not None}
+    if '?' not in url:
+        query = urlencode(params, doseq=True)
+        return f'{url}?{query}' if query else str(url)
     parsed_url = urlparse(url)
     current_params = parse_qs(parsed_url.query)
     current_params.update(params)
@@ -0,0 +1,7 @@
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    def render(self, content):
+        return to_json(content)
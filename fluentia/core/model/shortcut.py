@@ -1,4 +1,6 @@
 from fastapi import HTTPException, status
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import select
 
 
@@ -30,6 +32,33 @@ def get_or_create_object(Model, session, defaults=None, **kwargs):
             return instance, True
 
 
+def get_or_insert(Model, session, filters, index_elements, **data):
+    query = select(Model).where(*filters)
+    instance = session.exec(query).first()
+    while instance is None:
+        instance = session.exec(
+            insert(Model)
+            .values(**data)
+            .on_conflict_do_nothing(index_elements=index_elements)
+            .returning(Model)
+        ).scalar_one_or_none()
+        if instance is not None:
+            return instance, True
+        instance = session.exec(query).first()
+    return instance, False
+
+
+def paginate(session, query, page, size):
+    offset = (page - 1) * size
+    rows = session.exec(query.offset(offset).limit(size)).all()
+    if 0 < len(rows) < size or (page == 1 and not rows):
+        return rows, offset + len(rows)
+    total = session.exec(
+        select(func.count()).select_from(query.order_by(None).subquery())
+    ).one()
+    return rows, total
+
+
 def create(Model, session, **data):
     db_model = Model(**data)
 
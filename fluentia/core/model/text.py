@@ -0,0 +1,36 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+import sqlmodel as sm
+from sqlalchemy import DDL, event
+
+# clean_text must give the same result in Python and in Postgres: both
+# decompose with NFKD, lowercase character by character, drop the same
+# combining mark ranges and trim the same whitespace characters.
+COMBINING_MARKS = re.compile(
+    '[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]'
+)
+WHITESPACE = ' \t\n\r\f\v'
+
+CLEAN_TEXT_FUNCTION = r"""
+CREATE OR REPLACE FUNCTION clean_text(text) RETURNS text AS $$
+    SELECT btrim(regexp_replace(
+        lower(normalize($1, NFKD)),
+        '[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]',
+        '',
+        'g'
+    ), E' \t\n\r\f\x0b')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+"""
+
+sql_clean_text = sm.func.clean_text
+
+event.listen(sm.SQLModel.metadata, 'before_create', DDL(CLEAN_TEXT_FUNCTION))
+
+
+@lru_cache(maxsize=4096)
+def clean_text(text):
+    normalized = unicodedata.normalize('NFKD', str(text))
+    lowered = ''.join(char.lower() for char in normalized)
+    return COMBINING_MARKS.sub('', lowered).strip(WHITESPACE)
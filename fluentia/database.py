@@ -1,11 +1,19 @@
 from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session
 
-from fluentia.settings import Settings
+from fluentia.settings import get_settings
 
-engine = create_engine(Settings().database_url('fluentia'))
+engine = create_engine(
+    get_settings().database_url('fluentia'),
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+    query_cache_size=1200,
+)
+SessionLocal = sessionmaker(engine, class_=Session, expire_on_commit=False)
 
 
 def get_session():
-    with Session(engine) as session:
+    with SessionLocal() as session:
         yield session
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic import PostgresDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -25,3 +27,8 @@ class Settings(BaseSettings):
                 path=database_name,
             )
         )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
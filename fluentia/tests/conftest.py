@@ -6,7 +6,7 @@ from sqlmodel import Session, SQLModel, create_engine
 from fluentia.apps.user.security import get_password_hash
 from fluentia.database import get_session
 from fluentia.main import app
-from fluentia.settings import Settings
+from fluentia.settings import get_settings
 from fluentia.tests.factories.user import UserFactory
 
 
@@ -24,7 +24,7 @@ def client(session):
 
 @pytest.fixture
 def engine():
-    engine = create_engine(Settings().database_url('fluentia_test'))
+    engine = create_engine(get_settings().database_url('fluentia_test'))
     SQLModel.metadata.create_all(engine)
     yield engine
     SQLModel.metadata.drop_all(engine)
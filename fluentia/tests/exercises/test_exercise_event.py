@@ -2,8 +2,12 @@ from sqlmodel import select
 
 from fluentia.apps.exercises.constants import ExerciseType
 from fluentia.apps.exercises.models import Exercise
-from fluentia.apps.term.constants import TermLexicalType
-from fluentia.apps.term.models import PronunciationLink
+from fluentia.apps.term.constants import Language, TermLexicalType
+from fluentia.apps.term.models import (
+    PronunciationLink,
+    TermExample,
+    TermExampleTranslation,
+)
 from fluentia.tests.factories.term import (
     PronunciationFactory,
     TermDefinitionFactory,
@@ -31,6 +35,51 @@ def test_order_exercise_event(session):
     assert exercise is not None
 
 
+def test_order_exercise_event_resaved_translation(session):
+    example = TermExampleFactory()
+    translation = TermExampleTranslationFactory(term_example_id=example.id)
+    session.delete(translation)
+    session.commit()
+    TermExampleTranslationFactory(
+        term_example_id=example.id, language=translation.language
+    )
+
+    exercises = session.exec(
+        select(Exercise).where(
+            Exercise.term_example_id == example.id,
+            Exercise.translation_language == translation.language,
+            Exercise.type == ExerciseType.ORDER_SENTENCE,
+        )
+    ).all()
+
+    assert len(exercises) == 1
+
+
+def test_order_exercise_event_rolled_back_savepoint(session):
+    example = TermExampleFactory()
+
+    savepoint = session.begin_nested()
+    session.add(
+        TermExampleTranslation(
+            language=example.language,
+            term_example_id=example.id,
+            translation='translation',
+        )
+    )
+    session.flush()
+    savepoint.rollback()
+    session.commit()
+
+    exercise = session.exec(
+        select(Exercise).where(
+            Exercise.term_example_id == example.id,
+            Exercise.type == ExerciseType.ORDER_SENTENCE,
+        )
+    ).first()
+
+    assert exercise is None
+
+
 def test_listen_exercise_term(session):
     term = TermFactory()
     pronunciation = PronunciationFactory()
@@ -201,6 +250,27 @@ def test_speak_exercise_sentence(session):
     assert exercise is not None
 
 
+def test_speak_exercise_sentence_get_or_create(session):
+    db_example, created = TermExample.get_or_create(
+        session, example='Hello, how are you?', language=Language.ENGLISH
+    )
+    _, created_again = TermExample.get_or_create(
+        session, example=' hello, how are YOU? ', language=Language.ENGLISH
+    )
+
+    exercises = session.exec(
+        select(Exercise).where(
+            Exercise.language == Language.ENGLISH,
+            Exercise.term_example_id == db_example.id,
+            Exercise.type == ExerciseType.SPEAK_SENTENCE,
+        )
+    ).all()
+
+    assert created
+    assert not created_again
+    assert len(exercises) == 1
+
+
 def test_mchoice_term_exercise(session):
     term = TermFactory()
     TermLexicalFactory.create_batch(
@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import literal_column
 from sqlmodel import select
 
 from fluentia.apps.term.constants import Language, Level, PartOfSpeech, TermLexicalType
@@ -61,9 +62,12 @@ class TestTerm:
         self,
         text,
         origin_language,
+        limit=None,
     ):
         url = app.url_path_for('search_term')
-        return set_url_params(url, text=text, origin_language=origin_language)
+        return set_url_params(
+            url, text=text, origin_language=origin_language, limit=limit
+        )
 
     def search_term_meaning_route(self, text, origin_language, translation_language):
         url = app.url_path_for('search_term_meaning')
@@ -279,6 +283,29 @@ class TestTerm:
         assert len(response.json()) == 5
         assert [Term(**term) for term in response.json()] == terms
 
+    def test_search_term_limit(self, client, session):
+        terms = [
+            TermFactory(term=f'test {i:02}', origin_language=Language.PORTUGUESE)
+            for i in range(25)
+        ]
+
+        response = client.get(
+            self.search_term_route(text='test', origin_language=Language.PORTUGUESE)
+        )
+        [session.refresh(term) for term in terms]
+
+        assert response.status_code == 200
+        assert [Term(**term) for term in response.json()] == terms[:20]
+
+        response = client.get(
+            self.search_term_route(
+                text='test', origin_language=Language.PORTUGUESE, limit=3
+            )
+        )
+
+        assert response.status_code == 200
+        assert [Term(**term) for term in response.json()] == terms[:3]
+
     def test_search_term_empty(self, client):
         TermFactory.create_batch(20)
 
@@ -291,6 +318,16 @@ class TestTerm:
         assert response.status_code == 200
         assert len(response.json()) == 0
 
+    def test_search_term_blank_text(self, client):
+        TermFactory.create_batch(5, origin_language=Language.PORTUGUESE)
+
+        response = client.get(
+            self.search_term_route(text='  ', origin_language=Language.PORTUGUESE)
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+
     def test_search_term_form(self, client, session):
         terms = TermFactory.create_batch(5, origin_language=Language.PORTUGUESE)
         for i, term in enumerate(terms):
@@ -399,6 +436,37 @@ class TestTerm:
         for value in json:
             assert value in terms
 
+    def test_search_meaning_word_before_substring(self, client):
+        substring_term, word_term = TermFactory.create_batch(
+            origin_language=Language.PORTUGUESE, size=2
+        )
+        for term, meaning in (
+            (substring_term, 'contested'),
+            (word_term, 'a test case'),
+        ):
+            definition = TermDefinitionFactory(
+                term=term.term, origin_language=term.origin_language
+            )
+            TermDefinitionTranslationFactory(
+                meaning=meaning,
+                language=Language.DEUTSCH,
+                term_definition_id=definition.id,
+            )
+
+        response = client.get(
+            self.search_term_meaning_route(
+                'test',
+                origin_language=Language.PORTUGUESE,
+                translation_language=Language.DEUTSCH,
+            )
+        )
+
+        assert response.status_code == 200
+        assert [Term(**term) for term in response.json()] == [
+            word_term,
+            substring_term,
+        ]
+
     def test_search_meaning_empty(self, client):
         terms = TermFactory.create_batch(origin_language=Language.PORTUGUESE, size=5)
         definitions = [
@@ -923,6 +991,36 @@ class TestTermDefinition:
         assert response.status_code == 200
         assert TermDefinition(**response.json()) == db_definition
 
+    def test_definition_get_or_create(self, session):
+        term = TermFactory(term='Casa', origin_language=Language.PORTUGUESE)
+        data = {
+            'term': term.term,
+            'origin_language': term.origin_language,
+            'part_of_speech': PartOfSpeech.NOUN,
+            'definition': 'Lugar onde se mora.',
+        }
+
+        db_definition, created = TermDefinition.get_or_create(session, **data)
+        row_version = session.exec(
+            select(literal_column('xmin::text')).where(
+                TermDefinition.id == db_definition.id
+            )
+        ).one()
+        data.update(term='casa', definition=' lugar ONDE se mora. ')
+        same_definition, created_again = TermDefinition.get_or_create(session, **data)
+
+        assert created
+        assert not created_again
+        assert same_definition.id == db_definition.id
+        assert (
+            session.exec(
+                select(literal_column('xmin::text')).where(
+                    TermDefinition.id == db_definition.id
+                )
+            ).one()
+            == row_version
+        )
+
     @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
     def test_create_definition_passing_a_term_form_as_term(
         self, client, session, generate_payload, token_header
@@ -1416,6 +1514,23 @@ class TestTermDefinition:
         assert definition.level == payload['level']
         assert definition.extra == {'test1': 1, 'test2': 2}
 
+    @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
+    def test_update_definition_partial_extra(self, session, client, token_header):
+        definition = TermDefinitionFactory(extra={'test1': 1, 'test2': 2})
+        original_definition = definition.definition
+
+        response = client.patch(
+            self.update_definition_route(definition.id),
+            json={'extra': {'test2': 3, 'test3': 3}},
+            headers=token_header,
+        )
+        session.refresh(definition)
+
+        assert response.status_code == 200
+        assert response.json()['extra'] == {'test1': 1, 'test2': 3, 'test3': 3}
+        assert definition.extra == {'test1': 1, 'test2': 3, 'test3': 3}
+        assert definition.definition == original_definition
+
     def test_update_definition_user_not_authenticated(self, client, generate_payload):
         definition = TermDefinitionFactory()
         payload = generate_payload(
@@ -1486,6 +1601,30 @@ class TestTermDefinition:
         assert definition_translation.translation == payload['translation']
         assert definition_translation.extra == {'test1': 1, 'test2': 2}
 
+    @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
+    def test_update_definition_translation_partial_extra(
+        self, session, client, token_header
+    ):
+        definition = TermDefinitionFactory()
+        definition_translation = TermDefinitionTranslationFactory(
+            term_definition_id=definition.id, extra={'test1': 1, 'test2': 2}
+        )
+        original_meaning = definition_translation.meaning
+
+        response = client.patch(
+            self.update_definition_translation_route(
+                definition.id, definition_translation.language
+            ),
+            json={'extra': {'test2': 3, 'test3': 3}},
+            headers=token_header,
+        )
+        session.refresh(definition_translation)
+
+        assert response.status_code == 200
+        assert response.json()['extra'] == {'test1': 1, 'test2': 3, 'test3': 3}
+        assert definition_translation.extra == {'test1': 1, 'test2': 3, 'test3': 3}
+        assert definition_translation.meaning == original_meaning
+
     def test_update_definition_translation_user_not_authenticated(
         self, session, client, generate_payload
     ):
@@ -1623,6 +1762,28 @@ class TestTermExample:
         ).first()
         assert db_link is not None
 
+    def test_example_get_or_create(self, session):
+        data = {'example': 'Eu moro numa casa.', 'language': Language.PORTUGUESE}
+
+        db_example, created = TermExample.get_or_create(session, **data)
+        row_version = session.exec(
+            select(literal_column('xmin::text')).where(TermExample.id == db_example.id)
+        ).one()
+        data.update(example=' eu moro NUMA casa. ')
+        same_example, created_again = TermExample.get_or_create(session, **data)
+
+        assert created
+        assert not created_again
+        assert same_example.id == db_example.id
+        assert (
+            session.exec(
+                select(literal_column('xmin::text')).where(
+                    TermExample.id == db_example.id
+                )
+            ).one()
+            == row_version
+        )
+
     @parametrize_example_link
     @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
     def test_create_example(
@@ -1727,6 +1888,30 @@ class TestTermExample:
         assert response.status_code == 404
         assert db_factory.__class__.__name__ in response.json()['detail']
 
+    @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
+    def test_create_example_term_does_not_exists(
+        self, client, session, generate_payload, token_header
+    ):
+        payload = generate_payload(TermExampleFactory)
+        payload.update(
+            term='inexistente',
+            origin_language=Language.PORTUGUESE,
+            highlight=[[1, 4], [6, 8]],
+        )
+
+        response = client.post(
+            self.create_example_route, json=payload, headers=token_header
+        )
+
+        assert response.status_code == 404
+        assert response.json()['detail'] == 'Term does not exists.'
+        assert (
+            session.exec(
+                select(TermExampleLink).where(TermExampleLink.term == 'inexistente')
+            ).first()
+            is None
+        )
+
     @parametrize_example_link
     @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
     def test_create_example_with_conflict_link(
@@ -1957,6 +2142,56 @@ class TestTermExample:
         ).first()
         assert db_link is not None
 
+    @parametrize_example_link
+    @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
+    def test_create_example_translation_other_translation_exists(
+        self, client, generate_payload, token_header, item
+    ):
+        example = TermExampleFactory()
+        payload = generate_payload(TermExampleTranslationFactory)
+        payload.update(term_example_id=example.id)
+        TermExampleTranslationFactory(**payload)
+        Factory, attr = item
+        db_factory = Factory()
+        linked_attr = self._get_linked_attributes(attr, db_factory)
+        payload.update(
+            linked_attr,
+            translation=f'{payload["translation"]} other',
+            highlight=[[1, 4], [6, 8]],
+        )
+
+        response = client.post(
+            self.create_example_translation_route,
+            json=payload,
+            headers=token_header,
+        )
+
+        assert response.status_code == 409
+        assert (
+            response.json()['detail']
+            == 'the example already has a translation in this language.'
+        )
+
+    def test_example_translation_get_or_create_same_translation(self, session):
+        example = TermExampleFactory()
+        translation = TermExampleTranslationFactory(
+            term_example_id=example.id, translation='Eu moro numa casa.'
+        )
+
+        db_translation, created = TermExampleTranslation.get_or_create(
+            session,
+            language=translation.language,
+            term_example_id=example.id,
+            translation=' eu moro NUMA casa. ',
+        )
+
+        assert not created
+        assert db_translation.translation == 'Eu moro numa casa.'
+        assert (
+            db_translation.language,
+            db_translation.term_example_id,
+        ) == (translation.language, example.id)
+
     @parametrize_example_link
     @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
     def test_create_example_translation(
@@ -2063,6 +2298,32 @@ class TestTermExample:
         assert response.status_code == 404
         assert db_factory.__class__.__name__ in response.json()['detail']
 
+    @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
+    def test_create_example_translation_term_does_not_exists(
+        self, client, session, generate_payload, token_header
+    ):
+        example = TermExampleFactory()
+        payload = generate_payload(TermExampleTranslationFactory)
+        payload.update(
+            term='inexistente',
+            origin_language=Language.PORTUGUESE,
+            term_example_id=example.id,
+            highlight=[[1, 4], [6, 8]],
+        )
+
+        response = client.post(
+            self.create_example_translation_route, json=payload, headers=token_header
+        )
+
+        assert response.status_code == 404
+        assert response.json()['detail'] == 'Term does not exists.'
+        assert (
+            session.exec(
+                select(TermExampleLink).where(TermExampleLink.term == 'inexistente')
+            ).first()
+            is None
+        )
+
     @parametrize_example_link
     @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
     def test_create_example_translation_with_conflict(
@@ -2898,6 +3159,27 @@ class TestTermLexical:
 
         assert response.status_code == 404
 
+    @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
+    def test_create_lexical_term_never_created(
+        self, client, session, generate_payload, token_header
+    ):
+        payload = generate_payload(
+            TermLexicalFactory, term='inexistente', origin_language=Language.PORTUGUESE
+        )
+
+        response = client.post(
+            self.create_lexical_route, json=payload, headers=token_header
+        )
+
+        assert response.status_code == 404
+        assert response.json()['detail'] == 'Term does not exists.'
+        assert (
+            session.exec(
+                select(TermLexical).where(TermLexical.term == 'inexistente')
+            ).first()
+            is None
+        )
+
     def test_list_lexical(self, client):
         term = TermFactory()
         term_lexicals = TermLexicalFactory.create_batch(
@@ -3042,6 +3324,37 @@ class TestTermLexical:
         assert lexical.value == payload['value']
         assert lexical.extra == {'test1': 1, 'test2': 2}
 
+    @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
+    def test_update_lexical_partial_extra(self, session, client, token_header):
+        lexical = TermLexicalFactory(extra={'test1': 1, 'test2': 2})
+        original_value = lexical.value
+
+        response = client.patch(
+            self.update_lexical_route(lexical.id),
+            json={'extra': {'test2': 3, 'test3': 3}},
+            headers=token_header,
+        )
+        session.refresh(lexical)
+
+        assert response.status_code == 200
+        assert response.json()['extra'] == {'test1': 1, 'test2': 3, 'test3': 3}
+        assert lexical.extra == {'test1': 1, 'test2': 3, 'test3': 3}
+        assert lexical.value == original_value
+
+    @pytest.mark.parametrize('user', [{'is_superuser': True}], indirect=True)
+    def test_update_lexical_extra_when_empty(self, session, client, token_header):
+        lexical = TermLexicalFactory(extra=None)
+
+        response = client.patch(
+            self.update_lexical_route(lexical.id),
+            json={'extra': {'test1': 1}},
+            headers=token_header,
+        )
+        session.refresh(lexical)
+
+        assert response.status_code == 200
+        assert lexical.extra == {'test1': 1}
+
     def test_update_lexical_user_not_authenticated(self, client, generate_payload):
         lexical = TermLexicalFactory(extra={'test1': 1})
         payload = generate_payload(TermLexicalFactory, include={'value'})
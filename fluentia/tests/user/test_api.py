@@ -53,6 +53,17 @@ def test_update_user(session, client, user, token_header):
     assert user.username == payload['username']
 
 
+def test_update_user_email_already_exists(client, user, token_header):
+    other_user = UserFactory()
+    payload = {'email': other_user.email}
+
+    response = client.patch(
+        update_user_url(user.id), json=payload, headers=token_header
+    )
+
+    assert response.status_code == 409
+
+
 def test_update_user_not_authenticated(session, client):
     payload = {'username': 'my_new_name'}
 
@@ -5,7 +5,7 @@ from sqlalchemy import pool
 
 from alembic import context
 
-from fluentia.settings import Settings
+from fluentia.settings import get_settings
 from fluentia.apps.term.models import *
 from fluentia.apps.user.models import *
 from fluentia.apps.card.models import *
@@ -13,7 +13,7 @@ from fluentia.apps.exercises.models import *
 
 
 config = context.config
-config.set_main_option('sqlalchemy.url', Settings().database_url('fluentia'))
+config.set_main_option('sqlalchemy.url', get_settings().database_url('fluentia'))
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
@@ -0,0 +1,31 @@
+"""add trigram index on termlexical value
+
+Revision ID: 19a9a3143c7b
+Revises: 595fd8e7b31e
+Create Date: 2026-10-16 09:49:16.750156
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '19a9a3143c7b'
+down_revision: Union[str, None] = '595fd8e7b31e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        'CREATE INDEX termlexical_value_trgm_idx ON termlexical '
+        'USING GIN (clean_text(value) gin_trgm_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS termlexical_value_trgm_idx')
@@ -0,0 +1,29 @@
+"""add prefix index on term
+
+Revision ID: 2b91468b993b
+Revises: 8a899872e910
+Create Date: 2026-10-16 09:35:33.109638
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b91468b993b'
+down_revision: Union[str, None] = '8a899872e910'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE INDEX term_prefix_idx ON term (clean_text(term) text_pattern_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS term_prefix_idx')
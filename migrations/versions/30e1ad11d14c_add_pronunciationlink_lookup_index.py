@@ -0,0 +1,32 @@
+"""add pronunciationlink lookup index
+
+Revision ID: 30e1ad11d14c
+Revises: c3642bab0564
+Create Date: 2026-10-16 09:14:45.569443
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '30e1ad11d14c'
+down_revision: Union[str, None] = 'c3642bab0564'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_pl_term_origin',
+        'pronunciationlink',
+        ['term', 'origin_language', 'term_example_id', 'term_lexical_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pl_term_origin', table_name='pronunciationlink')
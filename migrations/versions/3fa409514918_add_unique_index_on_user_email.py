@@ -0,0 +1,27 @@
+"""add unique index on user email
+
+Revision ID: 3fa409514918
+Revises: f8a85a990432
+Create Date: 2026-10-16 10:52:16.216015
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3fa409514918'
+down_revision: Union[str, None] = 'f8a85a990432'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_user_email', 'user', ['email'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_email', table_name='user')
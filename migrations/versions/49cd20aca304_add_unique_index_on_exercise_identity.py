@@ -0,0 +1,61 @@
+"""add unique index on exercise identity
+
+Revision ID: 49cd20aca304
+Revises: 3fa409514918
+Create Date: 2026-10-16 10:59:19.781450
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '49cd20aca304'
+down_revision: Union[str, None] = '3fa409514918'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM exercise duplicate
+        USING exercise original
+        WHERE duplicate.id > original.id
+          AND duplicate.type = original.type
+          AND duplicate.language = original.language
+          AND duplicate.translation_language
+              IS NOT DISTINCT FROM original.translation_language
+          AND duplicate.term IS NOT DISTINCT FROM original.term
+          AND duplicate.origin_language IS NOT DISTINCT FROM original.origin_language
+          AND duplicate.term_example_id IS NOT DISTINCT FROM original.term_example_id
+          AND duplicate.pronunciation_id IS NOT DISTINCT FROM original.pronunciation_id
+          AND duplicate.term_lexical_id IS NOT DISTINCT FROM original.term_lexical_id
+          AND duplicate.term_definition_id
+              IS NOT DISTINCT FROM original.term_definition_id
+        """
+    )
+    op.create_index(
+        'ix_exercise_identity',
+        'exercise',
+        [
+            'type',
+            'language',
+            'translation_language',
+            'term',
+            'origin_language',
+            'term_example_id',
+            'pronunciation_id',
+            'term_lexical_id',
+            'term_definition_id',
+        ],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_exercise_identity', table_name='exercise')
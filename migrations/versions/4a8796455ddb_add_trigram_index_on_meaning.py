@@ -0,0 +1,32 @@
+"""add trigram index on definition translation meaning
+
+Revision ID: 4a8796455ddb
+Revises: 19a9a3143c7b
+Create Date: 2026-10-16 09:56:40.526143
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a8796455ddb'
+down_revision: Union[str, None] = '19a9a3143c7b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        'CREATE INDEX termdefinitiontranslation_meaning_trgm_idx '
+        'ON termdefinitiontranslation '
+        'USING GIN (clean_text(meaning) gin_trgm_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS termdefinitiontranslation_meaning_trgm_idx')
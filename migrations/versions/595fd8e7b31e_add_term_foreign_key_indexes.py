@@ -0,0 +1,37 @@
+"""add term foreign key indexes
+
+Revision ID: 595fd8e7b31e
+Revises: 2b91468b993b
+Create Date: 2026-10-16 09:42:03.998672
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '595fd8e7b31e'
+down_revision: Union[str, None] = '2b91468b993b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_termlexical_term',
+        'termlexical',
+        ['term', 'origin_language'],
+    )
+    op.create_index(
+        'ix_termdefinition_term',
+        'termdefinition',
+        ['term', 'origin_language'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_termdefinition_term', table_name='termdefinition')
+    op.drop_index('ix_termlexical_term', table_name='termlexical')
@@ -0,0 +1,30 @@
+"""add prefix index on termlexical value
+
+Revision ID: 825f9e8d0192
+Revises: ef07b607a2b0
+Create Date: 2026-10-16 10:31:18.130308
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '825f9e8d0192'
+down_revision: Union[str, None] = 'ef07b607a2b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE INDEX termlexical_value_prefix_idx '
+        'ON termlexical (clean_text(value) text_pattern_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS termlexical_value_prefix_idx')
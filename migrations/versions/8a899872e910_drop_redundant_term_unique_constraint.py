@@ -0,0 +1,29 @@
+"""drop redundant term unique constraint
+
+Revision ID: 8a899872e910
+Revises: e9e0ebdfe5e5
+Create Date: 2026-10-16 09:28:00.963535
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a899872e910'
+down_revision: Union[str, None] = 'e9e0ebdfe5e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint('term_term_origin_language_key', 'term', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint(
+        'term_term_origin_language_key', 'term', ['term', 'origin_language']
+    )
@@ -0,0 +1,32 @@
+"""add partial index on termlexical antonyms
+
+Revision ID: 8d34c1e7fe68
+Revises: d7b4de890564
+Create Date: 2026-10-16 10:10:19.606179
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d34c1e7fe68'
+down_revision: Union[str, None] = 'd7b4de890564'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_termlexical_antonym',
+        'termlexical',
+        ['term', 'origin_language'],
+        postgresql_where=sa.text("type = 'ANTONYM'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_termlexical_antonym', table_name='termlexical')
@@ -0,0 +1,61 @@
+"""define clean_text as immutable
+
+Revision ID: 92b018dcc9e2
+Revises: ab64594d3d13
+Create Date: 2026-10-16 10:24:43.227102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '92b018dcc9e2'
+down_revision: Union[str, None] = 'ab64594d3d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep whatever clean_text the database had so downgrade can put it back.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regprocedure('clean_text(text)') IS NOT NULL THEN
+                ALTER FUNCTION clean_text(text) RENAME TO clean_text_previous;
+            END IF;
+        END
+        $$
+        """
+    )
+    op.execute(
+        r"""
+        CREATE FUNCTION clean_text(text) RETURNS text AS $$
+            SELECT btrim(regexp_replace(
+                lower(normalize($1, NFKD)),
+                '[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]',
+                '',
+                'g'
+            ), E' \t\n\r\f\x0b')
+        $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP FUNCTION clean_text(text)')
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regprocedure('clean_text_previous(text)') IS NOT NULL THEN
+                ALTER FUNCTION clean_text_previous(text) RENAME TO clean_text;
+            END IF;
+        END
+        $$
+        """
+    )
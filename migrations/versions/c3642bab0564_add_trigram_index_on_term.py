@@ -0,0 +1,31 @@
+"""add trigram index on term
+
+Revision ID: c3642bab0564
+Revises: 92b018dcc9e2
+Create Date: 2026-10-16 09:07:26.084772
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3642bab0564'
+down_revision: Union[str, None] = '92b018dcc9e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        'CREATE INDEX term_trgm_idx ON term '
+        'USING GIN (clean_text(term) gin_trgm_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS term_trgm_idx')
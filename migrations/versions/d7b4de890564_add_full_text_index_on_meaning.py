@@ -0,0 +1,31 @@
+"""add full text index on definition translation meaning
+
+Revision ID: d7b4de890564
+Revises: 4a8796455ddb
+Create Date: 2026-10-16 10:03:17.889846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b4de890564'
+down_revision: Union[str, None] = '4a8796455ddb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE INDEX termdefinitiontranslation_meaning_tsv_idx '
+        'ON termdefinitiontranslation '
+        "USING GIN (to_tsvector('simple', clean_text(meaning)))"
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS termdefinitiontranslation_meaning_tsv_idx')
@@ -0,0 +1,103 @@
+"""add unique indexes for definition and example upserts
+
+Revision ID: e9e0ebdfe5e5
+Revises: 30e1ad11d14c
+Create Date: 2026-10-16 09:21:29.745972
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9e0ebdfe5e5'
+down_revision: Union[str, None] = '30e1ad11d14c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DEFINITION_CHILDREN = (
+    ('termdefinitiontranslation', 'term_definition_id', (('language',),)),
+    ('termexamplelink', 'term_definition_id', (('term_example_id',),)),
+    ('exercise', 'term_definition_id', ()),
+)
+EXAMPLE_CHILDREN = (
+    ('termexampletranslation', 'term_example_id', (('language',),)),
+    (
+        'termexamplelink',
+        'term_example_id',
+        (('term', 'origin_language'), ('term_definition_id',), ('term_lexical_id',)),
+    ),
+    ('pronunciationlink', 'term_example_id', ()),
+    ('exercise', 'term_example_id', ()),
+)
+
+
+def deduplicate(connection, table, partition, children):
+    """Keep the oldest row of each group that the new unique index would reject.
+
+    Rows referencing a duplicate are moved to the kept row unless that would
+    break one of their unique keys; those are removed with the duplicate.
+    """
+    duplicates = connection.execute(
+        sa.text(
+            f'SELECT id, keep_id FROM ('
+            f'SELECT id, min(id) OVER (PARTITION BY {partition}) AS keep_id '
+            f'FROM {table}) AS grouped '
+            f'WHERE id <> keep_id ORDER BY id'
+        )
+    ).all()
+    for duplicate_id, keep_id in duplicates:
+        ids = {'duplicate_id': duplicate_id, 'keep_id': keep_id}
+        for child, column, unique_keys in children:
+            statement = (
+                f'UPDATE {child} SET {column} = :keep_id '
+                f'WHERE {column} = :duplicate_id'
+            )
+            if unique_keys:
+                conflict = ' OR '.join(
+                    '('
+                    + ' AND '.join(f'other.{key} = {child}.{key}' for key in keys)
+                    + ')'
+                    for keys in unique_keys
+                )
+                statement += (
+                    f' AND NOT EXISTS (SELECT 1 FROM {child} AS other '
+                    f'WHERE other.{column} = :keep_id AND ({conflict}))'
+                )
+            connection.execute(sa.text(statement), ids)
+        connection.execute(
+            sa.text(f'DELETE FROM {table} WHERE id = :duplicate_id'), ids
+        )
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    deduplicate(
+        connection,
+        'termdefinition',
+        'clean_text(term), origin_language, part_of_speech, clean_text(definition)',
+        DEFINITION_CHILDREN,
+    )
+    deduplicate(
+        connection,
+        'termexample',
+        'clean_text(example), language',
+        EXAMPLE_CHILDREN,
+    )
+    op.execute(
+        'CREATE UNIQUE INDEX ix_termdefinition_clean_definition ON termdefinition '
+        '(clean_text(term), origin_language, part_of_speech, clean_text(definition))'
+    )
+    op.execute(
+        'CREATE UNIQUE INDEX ix_termexample_clean_example ON termexample '
+        '(clean_text(example), language)'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_termexample_clean_example', table_name='termexample')
+    op.drop_index('ix_termdefinition_clean_definition', table_name='termdefinition')
@@ -0,0 +1,37 @@
+"""add exercise lookup indexes
+
+Revision ID: ec60a71559c2
+Revises: 825f9e8d0192
+Create Date: 2026-10-16 10:38:08.614739
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ec60a71559c2'
+down_revision: Union[str, None] = '825f9e8d0192'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_exercise_language_type',
+        'exercise',
+        ['language', 'type'],
+    )
+    op.create_index(
+        'ix_exercise_pronunciation',
+        'exercise',
+        ['pronunciation_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_exercise_pronunciation', table_name='exercise')
+    op.drop_index('ix_exercise_language_type', table_name='exercise')
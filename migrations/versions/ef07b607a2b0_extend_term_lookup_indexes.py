@@ -0,0 +1,61 @@
+"""extend term lookup indexes
+
+Revision ID: ef07b607a2b0
+Revises: 8d34c1e7fe68
+Create Date: 2026-10-16 10:17:51.959149
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ef07b607a2b0'
+down_revision: Union[str, None] = '8d34c1e7fe68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_termlexical_term', table_name='termlexical')
+    op.create_index(
+        'ix_termlexical_term',
+        'termlexical',
+        ['term', 'origin_language', 'type'],
+    )
+    op.drop_index('ix_termdefinition_term', table_name='termdefinition')
+    op.create_index(
+        'ix_termdefinition_term',
+        'termdefinition',
+        ['term', 'origin_language', 'part_of_speech', 'level'],
+    )
+    op.create_index(
+        'ix_tdt_definition_language',
+        'termdefinitiontranslation',
+        ['term_definition_id', 'language'],
+    )
+    op.create_index(
+        'ix_tet_example_language',
+        'termexampletranslation',
+        ['term_example_id', 'language'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tet_example_language', table_name='termexampletranslation')
+    op.drop_index('ix_tdt_definition_language', table_name='termdefinitiontranslation')
+    op.drop_index('ix_termdefinition_term', table_name='termdefinition')
+    op.create_index(
+        'ix_termdefinition_term',
+        'termdefinition',
+        ['term', 'origin_language'],
+    )
+    op.drop_index('ix_termlexical_term', table_name='termlexical')
+    op.create_index(
+        'ix_termlexical_term',
+        'termlexical',
+        ['term', 'origin_language'],
+    )
@@ -0,0 +1,40 @@
+"""convert extra columns to jsonb
+
+Revision ID: f8a85a990432
+Revises: ec60a71559c2
+Create Date: 2026-10-16 10:45:30.000927
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8a85a990432'
+down_revision: Union[str, None] = 'ec60a71559c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ('termdefinition', 'termdefinitiontranslation', 'termlexical'):
+        op.alter_column(
+            table,
+            'extra',
+            type_=postgresql.JSONB(),
+            postgresql_using='extra::jsonb',
+        )
+
+
+def downgrade() -> None:
+    for table in ('termdefinition', 'termdefinitiontranslation', 'termlexical'):
+        op.alter_column(
+            table,
+            'extra',
+            type_=sa.JSON(),
+            postgresql_using='extra::json',
+        )